@@ -25,8 +25,11 @@ Date.parse() parses all possible representations of a datetime.date. """
 
 import calendar
 import locale
+import re
+import time
 from datetime import date, datetime, timedelta, timezone
 from enum import Enum
+from functools import lru_cache
 from gettext import gettext as _
 from gettext import ngettext
 
@@ -36,16 +39,50 @@ __all__ = ['Date', 'Accuracy']
 LOCAL_TIMEZONE = datetime.now(timezone.utc).astimezone().tzinfo
 NOW, SOON, SOMEDAY, NODATE = list(range(4))
 
+# Last clock reading as (monotonic time, datetime.now(), date.today()), it is
+# reused for a short while as many dates get compared when rendering a list
+_NOW_CACHE_TTL = 0.05
+_now_cache = [0.0, None, None]
+
+
+def _cached_now():
+    """Return the current naive datetime, read at most every few ms."""
+    timestamp = time.monotonic()
+    if timestamp - _now_cache[0] >= _NOW_CACHE_TTL or _now_cache[1] is None:
+        now = datetime.now()
+        _now_cache[:] = timestamp, now, now.date()
+    return _now_cache[1]
+
+
+def _cached_today():
+    """Return today's date, read at most every few ms."""
+    _cached_now()
+    return _now_cache[2]
+
+
+# The fuzzy values above are indexes in the following tuples
+
 # Localized strings for fuzzy values
-STRINGS = {
+STRINGS = (
     # Translators: Used for display
-    NOW: _('now'),
+    _('now'),
     # Translators: Used for display
-    SOON: _('soon'),
+    _('soon'),
     # Translators: Used for display
-    SOMEDAY: _('someday'),
-    NODATE: '',
-}
+    _('someday'),
+    '',
+)
+
+# English strings for fuzzy values, used for serialization
+_FUZZY_STR = ('now', 'soon', 'someday', '')
+
+# How far in the future fuzzy dates are when they need to be a real date
+_DELTA_BY_FUZZY = (
+    timedelta(0),
+    timedelta(days=15),
+    timedelta(days=365),
+    timedelta(days=9999),
+)
 
 # Allows looking up any value which is not a date but points towards one and
 # find one of the four constant for fuzzy dates: SOON, SOMEDAY, and NODATE
@@ -71,6 +108,14 @@ LOOKUP = {
     'none': NODATE,
 }
 
+# Strings resolving to the current time, they must never be cached
+_NOW_STRINGS = {'now', _('now').lower()}
+
+
+# Shared instances for every fuzzy value but NOW, returned by Date(). It is
+# filled once the instances are built, at the end of the module
+_DATE_CACHE = {}
+
 
 class Accuracy(Enum):
     """ GTG.core.dates.Date supported accuracies
@@ -89,6 +134,10 @@ class Accuracy(Enum):
     timezone = 'timezone'
 
 
+# date format from locale, and its variant without year for close dates
+_LOCALE_D_FMT = locale.nl_langinfo(locale.D_FMT)
+_LOCALE_D_FMT_NO_YEAR = _LOCALE_D_FMT.replace('/%Y', '').replace('.%Y', '.')
+
 # ISO 8601 date format
 # get date format from locale
 DATE_FORMATS = [(locale.nl_langinfo(locale.D_T_FMT), Accuracy.datetime),
@@ -98,9 +147,126 @@ DATE_FORMATS = [(locale.nl_langinfo(locale.D_T_FMT), Accuracy.datetime),
                 ('%Y-%m-%d %H:%M%S.%f', Accuracy.datetime),
                 ('%Y-%m-%dT%H:%M%S', Accuracy.datetime),
                 ('%Y-%m-%d %H:%M%S', Accuracy.datetime),
-                (locale.nl_langinfo(locale.D_FMT), Accuracy.date),
+                (_LOCALE_D_FMT, Accuracy.date),
                 ('%Y-%m-%d', Accuracy.date)]
 
+# index of week day names, in English and in the current locale, lowercased
+_WEEKDAY_INDEX = {name.lower(): index for index, names in enumerate([
+    ("Monday", _("Monday")),
+    ("Tuesday", _("Tuesday")),
+    ("Wednesday", _("Wednesday")),
+    ("Thursday", _("Thursday")),
+    ("Friday", _("Friday")),
+    ("Saturday", _("Saturday")),
+    ("Sunday", _("Sunday")),
+]) for name in names}
+
+# text representations whose offset in days doesn't depend on today
+_TEXT_FORMATS_STATIC = {
+    'today': 0,
+    # Translators: Used in parsing, made lowercased in code
+    _('today').lower(): 0,
+    'tomorrow': 1,
+    # Translators: Used in parsing, made lowercased in code
+    _('tomorrow').lower(): 1,
+    'next week': 7,
+    # Translators: Used in parsing, made lowercased in code
+    _('next week').lower(): 7,
+}
+
+# text representations whose offset depends on the current month or year
+_TEXT_NEXT_MONTH = {'next month',
+                    # Translators: Used in parsing, made lowercased in code
+                    _('next month').lower()}
+_TEXT_NEXT_YEAR = {'next year',
+                   # Translators: Used in parsing, made lowercased in code
+                   _('next year').lower()}
+
+# recurring terms whose offset in days is fixed, when the task isn't new
+_RECURRENCY_FORMATS_STATIC = {
+    'day': 1,
+    # Translators: Used in recurring parsing, made lowercased in code
+    _('day').lower(): 1,
+    'other-day': 2,
+    # Translators: Used in recurring parsing, made lowercased in code
+    _('other-day').lower(): 2,
+    'week': 7,
+    # Translators: Used in recurring parsing, made lowercased in code
+    _('week').lower(): 7,
+}
+
+# recurring terms whose offset depends on the month or year of the task
+_RECURRENCY_MONTH = {'month',
+                     # Translators: Used in recurring parsing, made lowercased in code
+                     _('month').lower()}
+_RECURRENCY_YEAR = {'year',
+                    # Translators: Used in recurring parsing, made lowercased in code
+                    _('year').lower()}
+
+# recurring terms for a new task, which starts on the date itself
+_NEW_RECURRENCY_FORMATS_STATIC = dict.fromkeys(
+    [*_RECURRENCY_FORMATS_STATIC, *_RECURRENCY_MONTH, *_RECURRENCY_YEAR], 0)
+
+
+@lru_cache(maxsize=8)
+def _year_length(year):
+    """Return the number of days in the given year."""
+    return 365 + int(calendar.isleap(year))
+
+
+def _weekday_offset(weekday, current_weekday):
+    """Return in how many days the next given week day is, 1 to 7."""
+    return weekday - current_weekday + 7 * int(weekday <= current_weekday)
+
+
+def _advance_to_mday(ref_date, mday):
+    """Return the next mday-th day of a month after ref_date.
+
+    Looks in the month of ref_date, then in the following one. If mday
+    doesn't exist in the following month either, the day in the month of
+    ref_date is kept even if it is not after ref_date, or None if it
+    doesn't exist at all.
+    """
+    year, month = ref_date.year, ref_date.month
+    _, last_mday = calendar.monthrange(year, month)
+    result = ref_date.replace(day=mday) if mday <= last_mday else None
+
+    if result is None or result <= ref_date:
+        if month == 12:
+            year, month = year + 1, 1
+        else:
+            month += 1
+        _, last_mday = calendar.monthrange(year, month)
+        if mday <= last_mday:
+            result = date(year, month, mday)
+
+    return result
+
+
+# Cheap structural checks run before the matching DATE_FORMATS entry, so that
+# strptime() is only called on strings which may actually fit the format
+_HAS_DIGIT = re.compile(r'\d').search
+# (as lenient as strptime: case insensitive, a space may pad the day and any
+# whitespace may separate the date from the time)
+_MAY_BE_ISO_T = re.compile(r'\d{4}-\d{1,2}-\s?\d{1,2}T', re.IGNORECASE).match
+_MAY_BE_ISO_SPACE = re.compile(r'\d{4}-\d{1,2}-\s?\d{1,2}\s').match
+_MAY_BE_ISO_DATE = re.compile(r'\d{4}-\d{1,2}-\s?\d{1,2}$').match
+
+
+def _format_predicate(date_format):
+    """Return the structural check matching the given strptime format."""
+    if date_format.startswith('%Y-%m-%dT'):
+        return _MAY_BE_ISO_T
+    if date_format.startswith('%Y-%m-%d '):
+        return _MAY_BE_ISO_SPACE
+    if date_format == '%Y-%m-%d':
+        return _MAY_BE_ISO_DATE
+    return _HAS_DIGIT
+
+
+_DATE_PARSERS = [(_format_predicate(date_format), date_format, accuracy)
+                 for date_format, accuracy in DATE_FORMATS]
+
 
 class Date:
     """A date class that supports fuzzy dates.
@@ -114,57 +280,140 @@ class Date:
       - a string containing a locale format date.
     """
 
-    __slots__ = ['dt_value']
+    __slots__ = ['dt_value', '_accuracy']
+
+    def __new__(cls, value=None):
+        # exact type checks first, they are much cheaper than isinstance()
+        value_type = type(value)
+        if value_type is date:
+            self = object.__new__(cls)
+            self.dt_value = value
+            self._accuracy = Accuracy.date
+            return self
+        if value_type is datetime:
+            self = object.__new__(cls)
+            self.dt_value = value
+            if value.tzinfo:
+                self._accuracy = Accuracy.timezone
+            else:
+                self._accuracy = Accuracy.datetime
+            return self
+        if value_type is Date:
+            # Date objects never change, no need to copy them
+            return value
+        if value_type is str or value_type is int or value is None:
+            # fuzzy dates (but now) are shared, Date objects never change
+            shared = _DATE_CACHE.get(value)
+            if shared is not None:
+                return shared
+
+        self = object.__new__(cls)
+        if value_type is str:
+            dt_value = cls.__parse_dt_str(value)
+            if dt_value is None:
+                raise ValueError(f"Unknown value for date: '{value}'")
+            self.dt_value = dt_value
+            if type(dt_value) is date:
+                self._accuracy = Accuracy.date
+            else:
+                self._accuracy = cls.__accuracy_of(dt_value)
+        else:
+            self.__set_value(value)
+        if self._accuracy is Accuracy.fuzzy:
+            # like 'SOON', which is only found once parsed
+            return _DATE_CACHE.get(self.dt_value, self)
+        return self
+
+    def __reduce__(self):
+        # copies and unpickled objects must go through __new__ as well
+        return self.__class__, (self.dt_value,)
+
+    def __set_value(self, value):
+        """Set dt_value and its accuracy from the value given to Date(),
+        for the values __new__ doesn't handle itself."""
+        if value is None:
+            self.dt_value = NODATE
+            self._accuracy = Accuracy.fuzzy
+            return
 
-    def __init__(self, value=None):
         self.dt_value = None
-        if isinstance(value, (date, datetime)):
+        if isinstance(value, str):
+            self.dt_value = self.__parse_dt_str(value)
+        elif isinstance(value, date):  # subclasses, including datetime ones
             self.dt_value = value
         elif isinstance(value, Date):
             # Copy internal values from other Date object
             self.dt_value = value.dt_value
-        elif value in {'None', None, ''}:
-            self.dt_value = NODATE
-        elif isinstance(value, str):
-            self.dt_value = self.__parse_dt_str(value)
         elif value == 0:  # support for dropped falsly fuzzy NOW
             self.dt_value = datetime.now()
         elif value in LOOKUP:
             self.dt_value = LOOKUP[value]
         if self.dt_value is None:
             raise ValueError(f"Unknown value for date: '{value}'")
+        self._accuracy = self.__accuracy_of(self.dt_value)
+
+    @classmethod
+    def get(cls, value):
+        """Return a Date for value, reusing already built instances.
+
+        On top of the fuzzy values shared by Date(), strings are memoized,
+        since Date objects are never mutated after creation.
+        """
+        if isinstance(value, Date):
+            return value
+        if isinstance(value, str) and value.lower() not in _NOW_STRINGS:
+            return _date_from_str(value)
+        return cls(value)
 
     @staticmethod
     def __parse_dt_str(string):
         """Will try casting given string into a datetime or a date."""
-        for cls in date, datetime:
-            try:
-                return cls.fromisoformat(string)
-            except (ValueError,  # ignoring no iso format value
-                    AttributeError):  # ignoring python < 3.7
-                pass
-        for date_format, accuracy in DATE_FORMATS:
+        iso_date = len(string) == 10 and string[4] == '-' and string[7] == '-'
+        if iso_date:
+            # plain ISO date, by far the most common in task files
             try:
-                dt_value = datetime.strptime(string, date_format)
-                if accuracy is Accuracy.date:
-                    dt_value = dt_value.date()
-                return dt_value
+                return date.fromisoformat(string)
             except ValueError:
                 pass
-        if string in {'now', _('now').lower()}:
+        # ISO 8601 formats all start with the year
+        if string[:4].isdecimal():
+            for cls in (datetime,) if iso_date else (date, datetime):
+                try:
+                    return cls.fromisoformat(string)
+                except (ValueError,  # ignoring no iso format value
+                        AttributeError):  # ignoring python < 3.7
+                    pass
+        # without any digit, it can only be a fuzzy date
+        if _HAS_DIGIT(string):
+            for predicate, date_format, accuracy in _DATE_PARSERS:
+                if not predicate(string):
+                    continue
+                try:
+                    dt_value = datetime.strptime(string, date_format)
+                    if accuracy is Accuracy.date:
+                        dt_value = dt_value.date()
+                    return dt_value
+                except ValueError:
+                    pass
+        if string in _NOW_STRINGS:
             return datetime.now()
         return LOOKUP.get(str(string).lower(), None)
 
-    @property
-    def accuracy(self):
-        if isinstance(self.dt_value, datetime):
-            if self.dt_value.tzinfo:
+    @staticmethod
+    def __accuracy_of(dt_value):
+        """Return the accuracy of a value Date could hold."""
+        if isinstance(dt_value, datetime):
+            if dt_value.tzinfo:
                 return Accuracy.timezone
             return Accuracy.datetime
-        if isinstance(self.dt_value, date):
+        if isinstance(dt_value, date):
             return Accuracy.date
         return Accuracy.fuzzy
 
+    @property
+    def accuracy(self):
+        return self._accuracy
+
     def date(self):
         """ Map date into real date, i.e. convert fuzzy dates """
         return self.dt_by_accuracy(Accuracy.date)
@@ -195,17 +444,16 @@ class Date:
         """Cast Date to the desired accuracy and returns either string
         for fuzzy, date, datetime or datetime with tzinfo.
         """
-        if wanted_accuracy == self.accuracy:
+        if wanted_accuracy == self._accuracy:
             return self.dt_value
-        if self.accuracy is Accuracy.fuzzy:
-            now = datetime.now()
-            delta_days = {SOON: 15, SOMEDAY: 365, NODATE: 9999}
-            gtg_date = Date(now + timedelta(delta_days[self.dt_value]))
-            if gtg_date.accuracy is wanted_accuracy:
-                return gtg_date.dt_value
-            return self._dt_by_accuracy(gtg_date.dt_value, gtg_date.accuracy,
+        if self._accuracy is Accuracy.fuzzy:
+            # always a naive datetime
+            target_dt = _cached_now() + _DELTA_BY_FUZZY[self.dt_value]
+            if wanted_accuracy is Accuracy.datetime:
+                return target_dt
+            return self._dt_by_accuracy(target_dt, Accuracy.datetime,
                                         wanted_accuracy)
-        return self._dt_by_accuracy(self.dt_value, self.accuracy,
+        return self._dt_by_accuracy(self.dt_value, self._accuracy,
                                     wanted_accuracy)
 
     def _cast_for_operation(self, other, is_comparison: bool = True):
@@ -213,20 +461,26 @@ class Date:
         Will settle for the less accuracy: comparing a date and a datetime
         will cast the datetime to a date to allow comparison.
         """
+        # most common case: two dates of the same accuracy, like due dates
+        if type(other) is Date and self._accuracy is other._accuracy:
+            return self.dt_value, other.dt_value
         if isinstance(other, timedelta):
             if is_comparison:
                 raise ValueError("can't compare with %r" % other)
             return self.dt_value, other
-        if not isinstance(other, self.__class__):
-            other = self.__class__(other)
-        if self.accuracy is other.accuracy:
+        if not isinstance(other, Date):
+            other = Date.get(other)
+        if self._accuracy is other._accuracy:
             return self.dt_value, other.dt_value
-        for accuracy in Accuracy.date, Accuracy.datetime, Accuracy.timezone:
-            if accuracy in {self.accuracy, other.accuracy}:
-                return (self.dt_by_accuracy(accuracy),
-                        other.dt_by_accuracy(accuracy))
-        return (self.dt_by_accuracy(Accuracy.fuzzy),
-                other.dt_by_accuracy(Accuracy.fuzzy))
+        # accuracies differ, so at least one of them isn't fuzzy
+        accuracies = self._accuracy, other._accuracy
+        if Accuracy.date in accuracies:
+            accuracy = Accuracy.date
+        elif Accuracy.datetime in accuracies:
+            accuracy = Accuracy.datetime
+        else:
+            accuracy = Accuracy.timezone
+        return self.dt_by_accuracy(accuracy), other.dt_by_accuracy(accuracy)
 
     def __add__(self, other):
         a, b = self._cast_for_operation(other, is_comparison=False)
@@ -240,6 +494,9 @@ class Date:
     __rsub__ = __sub__
 
     def __lt__(self, other):
+        # same accuracy dates are compared as is, that's what sorting needs
+        if type(other) is Date and self._accuracy is other._accuracy:
+            return self.dt_value < other.dt_value
         a, b = self._cast_for_operation(other)
         return a < b
 
@@ -248,12 +505,11 @@ class Date:
         return a <= b
 
     def __eq__(self, other):
+        if type(other) is Date and self._accuracy is other._accuracy:
+            return self.dt_value == other.dt_value
         a, b = self._cast_for_operation(other)
         return a == b
 
-    def __ne__(self, other):
-        return not self.__eq__(other)
-
     def __gt__(self, other):
         a, b = self._cast_for_operation(other)
         return a > b
@@ -264,9 +520,8 @@ class Date:
 
     def __str__(self):
         """ String representation - fuzzy dates are in English """
-        if self.accuracy is Accuracy.fuzzy:
-            strs = {SOON: 'soon', SOMEDAY: 'someday', NODATE: ''}
-            return strs[self.dt_value]
+        if self._accuracy is Accuracy.fuzzy:
+            return _FUZZY_STR[self.dt_value]
         return self.dt_value.isoformat()
 
     @property
@@ -274,14 +529,13 @@ class Date:
         """Will return displayable and localized string representation
         of the GTG.core.dates.Date.
         """
-        if self.accuracy is Accuracy.fuzzy:
+        if self._accuracy is Accuracy.fuzzy:
             return STRINGS[self.dt_value]
-        if self.accuracy is Accuracy.datetime:
-            span = timedelta(hours=1)
-            now = datetime.now()
-            if now - span <= self.dt_value < now + span:
+        if self._accuracy is Accuracy.datetime:
+            # within an hour from now
+            if abs((self.dt_value - _cached_now()).total_seconds()) < 3600:
                 return _('now')
-        return self.date().strftime(locale.nl_langinfo(locale.D_FMT))
+        return self.date().strftime(_LOCALE_D_FMT)
 
     def __repr__(self):
         return f"<Date({self})>"
@@ -294,13 +548,13 @@ class Date:
         True if the Date is one of the fuzzy values:
         now, soon, someday or no_date
         """
-        return self.accuracy is Accuracy.fuzzy
+        return self._accuracy is Accuracy.fuzzy
 
     def days_left(self):
         """ Return the difference between the date and today in dates """
         if self.dt_value == NODATE:
             return None
-        return (self.dt_by_accuracy(Accuracy.date) - date.today()).days
+        return (self.dt_by_accuracy(Accuracy.date) - _cached_today()).days
 
     @classmethod
     def today(cls):
@@ -333,98 +587,104 @@ class Date:
         return _GLOBAL_DATE_SOMEDAY
 
     @staticmethod
-    def _parse_only_month_day(string):
-        """ Parse next Xth day in month """
-        try:
-            mday = int(string)
-            if not 1 <= mday <= 31 or string.startswith('0'):
-                return None
-        except ValueError:
+    def _parse_only_month_day_from(ref_date, string):
+        """ Parse next Xth day in month from ref_date """
+        # int() would accept surrounding spaces and a plus sign
+        string = string.strip()
+        if string.startswith('+'):
+            string = string[1:]
+        if not (1 <= len(string) <= 2 and string.isdecimal()
+                and string[0] != '0'):
+            return None
+        mday = int(string)
+        if mday > 31:
             return None
 
-        today = date.today()
-        try:
-            result = today.replace(day=mday)
-        except ValueError:
-            result = None
+        return _advance_to_mday(ref_date, mday)
 
-        if result is None or result <= today:
-            if today.month == 12:
-                next_month = 1
-                next_year = today.year + 1
-            else:
-                next_month = today.month + 1
-                next_year = today.year
+    @staticmethod
+    def _parse_numerical_format_from(ref_date, string):
+        """Parse numerical formats like %Y/%m/%d, %Y%m%d or %m%d,
+        return None if it fails.
 
-            try:
-                result = date(next_year, next_month, mday)
-            except ValueError:
-                pass
+        Without a year, the first such day from ref_date on is returned.
+        """
+        # fixed width values are parsed by hand, as strptime is slow
+        length = len(string)
+        if length == 10 and string[4] == '/' and string[7] == '/' \
+                and (string[:4] + string[5:7] + string[8:]).isdecimal():
+            year, month, day = string[:4], string[5:7], string[8:]
+        elif length == 8 and string.isdecimal():
+            year, month, day = string[:4], string[4:6], string[6:]
+        elif length == 4 and string.isdecimal():
+            year, month, day = '', string[:2], string[2:]
+        elif _HAS_DIGIT(string):
+            # unpadded values like 41 or 201241, strptime is lenient enough
+            return Date._parse_numerical_format_strptime(ref_date, string)
+        else:
+            return None
 
-        return result
+        month, day = int(month), int(day)
+        if year:
+            year = int(year)
+        elif (month, day) == (2, 29):
+            # like strptime, which reads %m%d in 1900, not a leap year
+            return None
+        elif (month, day) >= (ref_date.month, ref_date.day):
+            year = ref_date.year
+        else:
+            # If the day has passed, assume the next year
+            year = ref_date.year + 1
+        try:
+            return date(year, month, day)
+        except ValueError:  # no such month or day
+            return None
 
     @staticmethod
-    def _parse_numerical_format(string):
-        """ Parse numerical formats like %Y/%m/%d, %Y%m%d or %m%d """
+    def _parse_numerical_format_strptime(ref_date, string):
+        """ Parse numerical formats like %Y/%m/%d, %Y%m%d or %m%d
+        which don't have a fixed width """
         result = None
-        today = date.today()
         for fmt in ['%Y/%m/%d', '%Y%m%d', '%m%d']:
             try:
                 result = datetime.strptime(string, fmt).date()
                 if '%Y' not in fmt:
                     # If the day has passed, assume the next year
-                    if result.month > today.month or \
-                            (result.month == today.month and result.day >= today.day):
-                        year = today.year
+                    if (result.month > ref_date.month or
+                        (result.month == ref_date.month and
+                         result.day >= ref_date.day)):
+                        year = ref_date.year
                     else:
-                        year = today.year + 1
+                        year = ref_date.year + 1
                     result = result.replace(year=year)
             except ValueError:
                 continue
         return result
 
     @staticmethod
-    def _parse_text_representation(string):
-        """ Match common text representation for date """
-        today = date.today()
-
-        # accepted date formats
-        formats = {
-            'today': 0,
-            # Translators: Used in parsing, made lowercased in code
-            _('today').lower(): 0,
-            'tomorrow': 1,
-            # Translators: Used in parsing, made lowercased in code
-            _('tomorrow').lower(): 1,
-            'next week': 7,
-            # Translators: Used in parsing, made lowercased in code
-            _('next week').lower(): 7,
-            'next month': calendar.mdays[today.month],
-            # Translators: Used in parsing, made lowercased in code
-            _('next month').lower(): calendar.mdays[today.month],
-            'next year': 365 + int(calendar.isleap(today.year)),
-            # Translators: Used in parsing, made lowercased in code
-            _('next year').lower(): 365 + int(calendar.isleap(today.year)),
-        }
-
-        # add week day names in the current locale
-        for i, (english, local) in enumerate([
-            ("Monday", _("Monday")),
-            ("Tuesday", _("Tuesday")),
-            ("Wednesday", _("Wednesday")),
-            ("Thursday", _("Thursday")),
-            ("Friday", _("Friday")),
-            ("Saturday", _("Saturday")),
-            ("Sunday", _("Sunday")),
-        ]):
-            offset = i - today.weekday() + 7 * int(i <= today.weekday())
-            formats[english.lower()] = offset
-            formats[local.lower()] = offset
-
-        offset = formats.get(string, None)
-        if offset is None:
+    def _parse_text_representation_from(ref_date, string, offsets,
+                                        next_month_terms=(),
+                                        next_year_terms=()):
+        """Match common text representation for date from ref_date
+
+        Args:
+            offsets (dict): offset in days of the terms not depending on
+                ref_date, besides week day names which are always accepted.
+            next_month_terms, next_year_terms: terms pointing to the same
+                day in the next month or year.
+        """
+        index = _WEEKDAY_INDEX.get(string)
+        if index is not None:
+            offset = _weekday_offset(index, ref_date.weekday())
+        elif string in offsets:
+            offset = offsets[string]
+        elif string in next_month_terms:
+            offset = calendar.mdays[ref_date.month]
+        elif string in next_year_terms:
+            offset = _year_length(ref_date.year)
+        else:
             return None
-        return today + timedelta(offset)
+        return ref_date + timedelta(offset)
 
     @classmethod
     def parse(cls, string):
@@ -442,127 +702,52 @@ class Date:
         else:
             string = string.lower()
 
-        # try the default formats
-        try:
+        if string in _NOW_STRINGS:
+            # the current time can't be served from the cache
             return cls(string)
-        except ValueError:
-            pass
 
-        # do several parsing
-        result = cls._parse_only_month_day(string)
-        if result is None:
-            result = cls._parse_numerical_format(string)
-        if result is None:
-            result = cls._parse_text_representation(string)
+        result = _parse_cached(string, _cached_today())
 
         # Announce the result
         if result is not None:
-            return cls(result)
+            return cls.get(result)
         else:
             raise ValueError(f"Can't parse date '{string}'")
 
-    def _parse_only_month_day_for_recurrency(self, string, newtask=True):
+    @classmethod
+    def _parse_only_month_day_for_recurrency(cls, self_date, string,
+                                             newtask=True):
         """ Parse next Xth day in month from a certain date"""
-        self_date = self.dt_by_accuracy(Accuracy.date)
         if not newtask:
             self_date += timedelta(1)
-        try:
-            mday = int(string)
-            if not 1 <= mday <= 31 or string.startswith('0'):
-                return None
-        except ValueError:
-            return None
+        return cls._parse_only_month_day_from(self_date, string)
 
-        try:
-            result = self_date.replace(day=mday)
-        except ValueError:
-            result = None
-
-        if result is None or result <= self_date:
-            if self_date.month == 12:
-                next_month = 1
-                next_year = self_date.year + 1
-            else:
-                next_month = self_date.month + 1
-                next_year = self_date.year
-
-            try:
-                result = date(next_year, next_month, mday)
-            except ValueError:
-                pass
-
-        return result
-
-    def _parse_numerical_format_for_recurrency(self, string, newtask=True):
+    @classmethod
+    def _parse_numerical_format_for_recurrency(cls, self_date, string,
+                                               newtask=True):
         """ Parse numerical formats like %Y/%m/%d,
         %Y%m%d or %m%d and calculated from a certain date"""
-        self_date = self.dt_by_accuracy(Accuracy.date)
-        result = None
         if not newtask:
             self_date += timedelta(1)
-        for fmt in ['%Y/%m/%d', '%Y%m%d', '%m%d']:
-            try:
-                result = datetime.strptime(string, fmt).date()
-                if '%Y' not in fmt:
-                    # If the day has passed, assume the next year
-                    if (result.month > self_date.month or
-                        (result.month == self_date.month and
-                         result.day >= self_date.day)):
-                        year = self_date.year
-                    else:
-                        year = self_date.year + 1
-                    result = result.replace(year=year)
-            except ValueError:
-                continue
-        return result
+        return cls._parse_numerical_format_from(self_date, string)
 
-    def _parse_text_representation_for_recurrency(self, string, newtask=False):
-        """Match common text representation from a certain date(self)
+    @classmethod
+    def _parse_text_representation_for_recurrency(cls, self_date, string,
+                                                  newtask=False):
+        """Match common text representation from a certain date
 
         Args:
+            self_date (datetime.date): date to count from.
             string (str): text representation.
             newtask (bool, optional): depending on the task if it is new, the offset changes
         """
-        # accepted date formats
-        self_date = self.dt_by_accuracy(Accuracy.date)
-        formats = {
-            # change the offset depending on the task.
-            'day': 0 if newtask else 1,
-            # Translators: Used in recurring parsing, made lowercased in code
-            _('day').lower(): 0 if newtask else 1,
-            'other-day': 0 if newtask else 2,
-            # Translators: Used in recurring parsing, made lowercased in code
-            _('other-day').lower(): 0 if newtask else 2,
-            'week': 0 if newtask else 7,
-            # Translators: Used in recurring parsing, made lowercased in code
-            _('week').lower(): 0 if newtask else 7,
-            'month': 0 if newtask else calendar.mdays[self_date.month],
-            # Translators: Used in recurring parsing, made lowercased in code
-            _('month').lower(): 0 if newtask else calendar.mdays[self_date.month],
-            'year': 0 if newtask else 365 + int(calendar.isleap(self_date.year)),
-            # Translators: Used in recurring parsing, made lowercased in code
-            _('year').lower(): 0 if newtask else 365 + int(calendar.isleap(self_date.year)),
-        }
-
-        # add week day names in the current locale
-        for i, (english, local) in enumerate([
-            ("Monday", _("Monday")),
-            ("Tuesday", _("Tuesday")),
-            ("Wednesday", _("Wednesday")),
-            ("Thursday", _("Thursday")),
-            ("Friday", _("Friday")),
-            ("Saturday", _("Saturday")),
-            ("Sunday", _("Sunday")),
-        ]):
-            offset = i - self_date.weekday() + 7 * int(i <= self_date.weekday())
-            formats[english.lower()] = offset
-            formats[local.lower()] = offset
-
-        offset = formats.get(string, None)
-        if offset is None:
-            return None
-        else:
-            return self_date + timedelta(offset)
+        # change the offset depending on the task.
+        if newtask:
+            return cls._parse_text_representation_from(
+                self_date, string, _NEW_RECURRENCY_FORMATS_STATIC)
+        return cls._parse_text_representation_from(
+            self_date, string, _RECURRENCY_FORMATS_STATIC,
+            _RECURRENCY_MONTH, _RECURRENCY_YEAR)
 
     def parse_from_date(self, string, newtask=False):
         """parse_from_date returns the date from a string
@@ -573,15 +758,20 @@ class Date:
             string = string.lower()
 
         try:
-            return Date(string)
+            return Date.get(string)
         except ValueError:
             pass
 
-        result = self._parse_only_month_day_for_recurrency(string, newtask)
+        # computed once, for fuzzy dates it needs the current time
+        self_date = self.dt_by_accuracy(Accuracy.date)
+        result = self._parse_only_month_day_for_recurrency(
+            self_date, string, newtask)
         if result is None:
-            result = self._parse_numerical_format_for_recurrency(string, newtask)
+            result = self._parse_numerical_format_for_recurrency(
+                self_date, string, newtask)
         if result is None:
-            result = self._parse_text_representation_for_recurrency(string, newtask)
+            result = self._parse_text_representation_for_recurrency(
+                self_date, string, newtask)
 
         if result is not None:
             return Date(result)
@@ -595,7 +785,7 @@ class Date:
         Close dates => Today, Tomorrow, In X days
         Other => with locale dateformat, stripping year for this year
         """
-        if self.accuracy is Accuracy.fuzzy:
+        if self._accuracy is Accuracy.fuzzy:
             return STRINGS[self.dt_value]
 
         days_left = self.days_left()
@@ -609,18 +799,52 @@ class Date:
             return ngettext('Tomorrow', 'In %(days)d days', days_left) % \
                 {'days': days_left}
         else:
-            locale_format = locale.nl_langinfo(locale.D_FMT)
-            if calendar.isleap(date.today().year):
-                year_len = 366
-            else:
-                year_len = 365
+            locale_format = _LOCALE_D_FMT
+            year_len = _year_length(_cached_today().year)
             if float(days_left) / year_len < 1.0:
                 # if it's in less than a year, don't show the year field
-                locale_format = locale_format.replace('/%Y', '')
-                locale_format = locale_format.replace('.%Y', '.')
+                locale_format = _LOCALE_D_FMT_NO_YEAR
             return self.dt_by_accuracy(Accuracy.date).strftime(locale_format)
 
 
 _GLOBAL_DATE_SOON = Date(SOON)
 _GLOBAL_DATE_NODATE = Date(NODATE)
 _GLOBAL_DATE_SOMEDAY = Date(SOMEDAY)
+
+_DATE_CACHE.update({
+    key: {SOON: _GLOBAL_DATE_SOON,
+          SOMEDAY: _GLOBAL_DATE_SOMEDAY,
+          NODATE: _GLOBAL_DATE_NODATE}[value]
+    for key, value in LOOKUP.items() if value != NOW
+})
+_DATE_CACHE['None'] = _GLOBAL_DATE_NODATE
+
+
+@lru_cache(maxsize=1024)
+def _date_from_str(string):
+    """Build a Date from a string, memoizing the (immutable) result."""
+    return Date(string)
+
+
+@lru_cache(maxsize=2048)
+def _parse_cached(string, today):
+    """Return the value Date.parse() finds for a lowercased string, or None.
+
+    Relative formats like 'tomorrow' are computed from today, which is part
+    of the cache key so that they are parsed again once the day changes.
+    """
+    # try the default formats
+    try:
+        return Date(string).dt_value
+    except ValueError:
+        pass
+
+    # do several parsing
+    result = Date._parse_only_month_day_from(today, string)
+    if result is None:
+        result = Date._parse_numerical_format_from(today, string)
+    if result is None:
+        result = Date._parse_text_representation_from(
+            today, string, _TEXT_FORMATS_STATIC,
+            _TEXT_NEXT_MONTH, _TEXT_NEXT_YEAR)
+    return result
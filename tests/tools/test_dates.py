@@ -16,11 +16,12 @@
 # this program.  If not, see <http://www.gnu.org/licenses/>.
 # -----------------------------------------------------------------------------
 
-from datetime import date, timedelta
+import copy
+from datetime import date, datetime, timedelta, timezone
 from unittest import TestCase
 
 from gettext import gettext as _
-from GTG.core.dates import Date
+from GTG.core.dates import DATE_FORMATS, Accuracy, Date, _parse_cached
 
 
 def next_month(aday, day=None):
@@ -43,6 +44,30 @@ class TestDates(TestCase):
         self.assertEqual(str(Date.parse("19850329")), "1985-03-29")
         self.assertEqual(str(Date.parse("1985/03/29")), "1985-03-29")
 
+    def test_parses_date_formats(self):
+        """ Every entry of DATE_FORMATS is parsed, whatever the case """
+        value = datetime(1985, 3, 29, 10, 0, 5, 500000, tzinfo=timezone.utc)
+        for date_format, accuracy in DATE_FORMATS:
+            string = value.strftime(date_format)
+            try:
+                expected = datetime.strptime(string, date_format)
+            except ValueError:
+                # some locale formats can't be read back by strptime
+                continue
+            if accuracy is Accuracy.date:
+                expected = expected.date()
+            with self.subTest(date_format=date_format, string=string):
+                self.assertEqual(Date(string).dt_value, expected)
+                self.assertEqual(Date.parse(string).dt_value, expected)
+        # strptime accepts a space padded day and any separating whitespace
+        for string, expected in [
+                ("2012-04- 1", date(2012, 4, 1)),
+                ("2012-04- 1 10:0000", datetime(2012, 4, 1, 10, 0)),
+                ("2012-04-01\t10:0000", datetime(2012, 4, 1, 10, 0))]:
+            with self.subTest(string=string):
+                self.assertEqual(Date(string).dt_value, expected)
+                self.assertEqual(Date.parse(string).dt_value, expected)
+
     def test_parses_todays_month_day_format(self):
         today = date.today()
         parse_string = "%02d%02d" % (today.month, today.day)
@@ -139,9 +164,90 @@ class TestDates(TestCase):
             ["2021-07-21", "month", True, None],
             ["2021-07-21", "01", True, None],
             ["2021-02-21", "31", True, "2021-03-31"],
+            ["2020-01-01", " 15", True, "2020-01-15"],
+            ["2020-01-01", "15 ", True, "2020-01-15"],
+            ["2020-01-01", "+15", True, "2020-01-15"],
+            ["2020-01-01", "1 5", True, None],
+        ]
+
+        for data in test_set:
+            init_date, param, newtask, expected = data
+            r = Date._parse_only_month_day_for_recurrency(
+                Date(init_date).date(), param, newtask)
+            self.assertEqual(str(r), str(expected))
+
+    def test_get_reuses_instances(self):
+        """ Date.get() returns shared instances for fuzzy and string values """
+        self.assertIs(Date.get(''), Date.no_date())
+        self.assertIs(Date.get(None), Date.no_date())
+        self.assertIs(Date.get('soon'), Date.soon())
+        self.assertIs(Date.get('later'), Date.someday())
+        self.assertIs(Date.get('1985-03-29'), Date.get('1985-03-29'))
+        self.assertEqual(Date.get('1985-03-29'), date(1985, 3, 29))
+        self.assertIsNot(Date.get('now'), Date.get('now'))
+
+    def test_parse_text_representation_for_recurrency(self):
+        #   ["today", "recurring term", newtask, "expected"]
+        test_set = [
+            ["2020-01-15", "day", True, "2020-01-15"],
+            ["2020-01-15", "day", False, "2020-01-16"],
+            ["2020-01-15", "other-day", False, "2020-01-17"],
+            ["2020-01-15", "week", False, "2020-01-22"],
+            ["2020-01-15", "month", False, "2020-02-15"],
+            ["2020-01-15", "year", False, "2021-01-15"],
+            ["2020-01-15", "monday", True, "2020-01-20"],
+            ["2020-01-15", "wednesday", False, "2020-01-22"],
+            ["2020-01-15", "fortnight", False, None],
         ]
 
         for data in test_set:
             init_date, param, newtask, expected = data
-            r = Date(init_date)._parse_only_month_day_for_recurrency(param, newtask)
+            r = Date._parse_text_representation_for_recurrency(
+                Date(init_date).date(), param, newtask)
             self.assertEqual(str(r), str(expected))
+
+    def test_parse_numerical_format_for_recurrency(self):
+        #   ["today", "numerical date", newtask, "expected"]
+        test_set = [
+            ["2020-01-15", "2021/03/29", True, "2021-03-29"],
+            ["2020-01-15", "20210329", True, "2021-03-29"],
+            ["2020-01-15", "0329", True, "2020-03-29"],
+            ["2020-01-15", "0115", True, "2020-01-15"],
+            ["2020-01-15", "0115", False, "2021-01-15"],
+            ["2020-01-15", "1301", True, None],
+            ["2024-01-01", "0229", True, None],
+            ["2024-01-01", "20240229", True, "2024-02-29"],
+            ["2020-01-15", "41", True, "2020-04-01"],
+            ["2020-01-15", "115", True, "2020-11-05"],
+            ["2020-01-15", "201241", True, "2012-04-01"],
+            ["2020-01-15", "2021/3/9", True, "2021-03-09"],
+            ["2020-01-15", "march", True, None],
+        ]
+
+        for data in test_set:
+            init_date, param, newtask, expected = data
+            r = Date._parse_numerical_format_for_recurrency(
+                Date(init_date).date(), param, newtask)
+            self.assertEqual(str(r), str(expected))
+
+    def test_fuzzy_dates_are_shared(self):
+        """ Building a fuzzy date returns the shared instance """
+        self.assertIs(Date(), Date.no_date())
+        self.assertIs(Date('None'), Date.no_date())
+        self.assertIs(Date('SOON'), Date.soon())
+        self.assertIs(Date(Date.someday()), Date.someday())
+        self.assertIs(copy.deepcopy(Date.soon()), Date.soon())
+
+    def test_parse_cache_depends_on_today(self):
+        """ Relative dates are parsed again once the day changes """
+        for string in ['tomorrow', 'monday', '5']:
+            with self.subTest(string=string):
+                first = _parse_cached(string, date(2020, 1, 1))
+                second = _parse_cached(string, date(2020, 1, 10))
+                self.assertNotEqual(first, second)
+                self.assertEqual(_parse_cached(string, date(2020, 1, 1)),
+                                 first)
+        self.assertEqual(_parse_cached('tomorrow', date(2020, 1, 1)),
+                         date(2020, 1, 2))
+        self.assertEqual(_parse_cached('tomorrow', date(2020, 1, 10)),
+                         date(2020, 1, 11))